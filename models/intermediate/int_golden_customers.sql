@@ -25,6 +25,11 @@
     - Exact match on cross-system IDs stored in Stripe metadata
     - Fuzzy match on email address (case-insensitive)
     - Fuzzy match on normalized company name + postal code
+
+    Change detection:
+    - hash_diff covers the resolved IDs and attributes (not the load
+      timestamps), so downstream models can tell real changes apart from
+      a rebuild of this table.
 */
 
 with stripe_customers as (
@@ -204,6 +209,25 @@ final as (
     left join sf_accounts sf
         on gi.salesforce_account_id = sf.sf_account_id
 
+),
+
+-- Step 6: Hash the resolved attributes for downstream change detection
+hashed as (
+
+    select
+        *,
+        {{ dbt_utils.generate_surrogate_key([
+            'stripe_customer_id', 'quickbooks_customer_id',
+            'netsuite_customer_id', 'salesforce_account_id',
+            'company_name', 'first_name', 'last_name', 'email', 'phone',
+            'website', 'billing_address', 'billing_city', 'billing_state',
+            'billing_postal_code', 'billing_country', 'industry',
+            'annual_revenue', 'employee_count', 'customer_segment',
+            'is_active_accounting', 'is_delinquent', 'primary_source',
+            'is_multi_source_match'
+        ]) }}                                               as hash_diff
+    from final
+
 )
 
-select * from final
+select * from hashed
@@ -1,5 +1,12 @@
 {{
-    config(materialized='table')
+    config(
+        materialized='incremental',
+        unique_key='customer_key',
+        on_schema_change='append_new_columns',
+        post_hook=[
+            "delete from {{ this }} where customer_key not in (select customer_golden_id from {{ ref('int_golden_customers') }})"
+        ]
+    )
 }}
 
 /*
@@ -7,6 +14,15 @@
     -------------
     Conformed customer dimension built from the golden customer record.
     Enriched with lifetime transaction metrics.
+
+    Incremental on hash_diff: only customers whose golden attributes or
+    transaction metrics changed are merged, so _dim_updated_at (and the
+    snap_dim_customers history) only moves on real changes. Customers that
+    drop out of the golden record are removed by the post-hook.
+
+    The hash_diff filter is skipped while the existing relation predates the
+    column, so the first run after migrating from a table merges every row
+    and on_schema_change adds hash_diff to it.
 */
 
 with golden as (
@@ -89,6 +105,17 @@ final as (
         -- Metadata
         g.first_seen_at,
         g.updated_at,
+        {{ dbt_utils.generate_surrogate_key([
+            'g.hash_diff',
+            'g.first_seen_at',
+            'g.updated_at',
+            'tm.lifetime_transaction_count',
+            'tm.lifetime_transaction_value',
+            'tm.lifetime_revenue',
+            'tm.first_transaction_date',
+            'tm.last_transaction_date',
+            'tm.source_system_count'
+        ]) }}                                               as hash_diff,
         current_timestamp()                                 as _dim_updated_at
 
     from golden g
@@ -98,3 +125,13 @@ final as (
 )
 
 select * from final
+
+{% if is_incremental() %}
+{%- set existing_columns = adapter.get_columns_in_relation(this) | map(attribute='name') | map('lower') | list -%}
+{% if 'hash_diff' in existing_columns %}
+where customer_key not in (
+    select customer_key from {{ this }}
+    where hash_diff = final.hash_diff
+)
+{% endif %}
+{% endif %}
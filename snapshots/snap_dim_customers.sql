@@ -4,12 +4,21 @@
     config(
         target_schema='snapshots',
         unique_key='customer_key',
-        strategy='timestamp',
-        updated_at='_dim_updated_at',
+        strategy='check',
+        check_cols=['hash_diff'],
         invalidate_hard_deletes=true
     )
 }}
 
+/*
+    Versions a customer only when dim_customers.hash_diff changes, so
+    rebuilds that leave a customer's attributes untouched add no history.
+
+    Rows snapshotted under the earlier timestamp strategy have a null
+    hash_diff, so the first run after the switch re-versions every customer
+    once. Later runs only version real changes.
+*/
+
 select * from {{ ref('dim_customers') }}
 
 {% endsnapshot %}